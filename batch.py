@@ -0,0 +1,126 @@
+import os
+import tempfile
+import time
+from typing import Tuple
+
+from playfaircipher import (
+    CompiledKey,
+    filter_input,
+    iter_bigrams,
+    format_five,
+    restore_spaces,
+    remove_padding,
+    SPACE_MARKER,
+)
+from records import copy_mode
+
+CHUNK_SIZE = 1 << 16  # Pocet znakov vstupu medzi hlaseniami priebehu
+MAX_WORKERS = 4
+OUTPUT_SUFFIXES = {False: ".encrypted", True: ".decrypted"}
+
+# Nastavi init_worker v kazdom procese
+_progress_queue = None
+_cancel_event = None
+
+
+class JobCancelled(Exception):
+    pass
+
+
+# Pocet procesov pre davkove spracovanie
+def worker_count() -> int:
+    return max(1, min(MAX_WORKERS, os.cpu_count() or 1))
+
+
+# Spusta sa v kazdom procese, ulozi frontu pre priebeh a signal na zrusenie
+def init_worker(progress_queue, cancel_event) -> None:
+    global _progress_queue, _cancel_event
+    _progress_queue = progress_queue
+    _cancel_event = cancel_event
+
+
+# Nahlasi priebeh a skonci, ak bolo spracovanie zrusene
+def report(job_id: int, done: int, total: int) -> None:
+    if _cancel_event is not None and _cancel_event.is_set():
+        raise JobCancelled()
+    if _progress_queue is not None:
+        _progress_queue.put((job_id, done, total))
+
+
+# Cesta k vystupnemu suboru, napr. report.txt -> report.encrypted.txt
+def output_path(source: str, target_dir: str, decrypt: bool = False) -> str:
+    stem, extension = os.path.splitext(os.path.basename(source))
+    suffix = OUTPUT_SUFFIXES[decrypt]
+    return os.path.join(target_dir, f"{stem}{suffix}{extension}")
+
+
+# Zisti, ci subor je vysledkom rovnakej operacie (napr. report.encrypted.txt pri sifrovani)
+def is_output_file(path: str, decrypt: bool = False) -> bool:
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return stem.endswith(OUTPUT_SUFFIXES[decrypt])
+
+
+# Zasifruje text po castiach, bigramy pri konci casti sa dokoncia s dalsou castou
+def encrypt_chunks(job_id: int, text: str, compiled: CompiledKey) -> str:
+    alphabet = compiled.alphabet
+    parts = []
+    pending = ""
+    for offset in range(0, len(text), CHUNK_SIZE):
+        report(job_id, offset, len(text))
+        pending += filter_input(text[offset : offset + CHUNK_SIZE], alphabet)
+        final = offset + CHUNK_SIZE >= len(text)
+        rest = len(pending)
+        for i, bigram in iter_bigrams(pending, alphabet):
+            # Bigram zavisi najviac od len(SPACE_MARKER) znakov od svojho zaciatku
+            if not final and i + len(SPACE_MARKER) > len(pending):
+                rest = i
+                break
+            parts.append(compiled[bigram])
+        pending = pending[rest:]
+    return format_five("".join(parts))
+
+
+# Desifruje text po castiach parnej dlzky, padding odstrani az na konci
+def decrypt_chunks(job_id: int, text: str, compiled: CompiledKey) -> str:
+    cipher_clean = "".join(text.split()).upper()
+    if len(cipher_clean) % 2:
+        raise ValueError("Ciphertext must have an even number of characters!")
+    parts = []
+    for offset in range(0, len(cipher_clean), CHUNK_SIZE):
+        report(job_id, offset, len(cipher_clean))
+        chunk = cipher_clean[offset : offset + CHUNK_SIZE]
+        parts.extend(compiled[chunk[i : i + 2]] for i in range(0, len(chunk), 2))
+    return remove_padding(restore_spaces("".join(parts)))
+
+
+# Spracuje jeden subor a vrati (pocet znakov vstupu, cas v sekundach)
+def process_file(
+    job_id: int,
+    source: str,
+    target: str,
+    key: str,
+    alphabet: str,
+    decrypt: bool = False,
+) -> Tuple[int, float]:
+    start = time.perf_counter()
+    compiled = CompiledKey(key, alphabet, decrypt)
+    with open(source, "r", encoding="utf-8") as f:
+        text = f.read()
+    if decrypt:
+        result = decrypt_chunks(job_id, text, compiled)
+    else:
+        result = encrypt_chunks(job_id, text, compiled)
+    report(job_id, len(text), len(text))
+    # Zapisuje sa do docasneho suboru vedla ciela, ciel sa nahradi az po uspechu
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(target)), suffix=".tmp"
+    )
+    try:
+        with open(fd, "w", encoding="utf-8") as f:
+            f.write(result)
+        copy_mode(target, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return (len(text), time.perf_counter() - start)
@@ -1,5 +1,10 @@
+import multiprocessing
+import os
+import queue
+import time
 import tkinter as tk
-from tkinter import messagebox, ttk
+from concurrent.futures import ProcessPoolExecutor
+from tkinter import filedialog, messagebox, ttk
 
 # Oprava DPI scalingu na Windows pre ostrejsie zobrazenie
 try:
@@ -14,12 +19,22 @@ except:
     except:
         pass
 
+from batch import (
+    JobCancelled,
+    init_worker,
+    is_output_file,
+    output_path,
+    process_file,
+    worker_count,
+)
 from playfaircipher import (
+    validate_key,
     encrypt,
     decrypt,
     format_five,
     create_matrix,
     find_position,
+    LiveEncryptor,
     ALPHABET_CZECH,
     ALPHABET_ENGLISH,
 )
@@ -46,7 +61,11 @@ class PlayfairCipherGUI:
         self.root.configure(bg=DARK_BG)
         self.current_alphabet = ALPHABET_CZECH
         self.alphabet_var = tk.StringVar(value="CZECH")
+        self.live_var = tk.BooleanVar(value=False)
+        self.live = None
+        self.batch_panel = None
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
 
     def setup_ui(self):
         # Vytvorenie hlavneho framu a rozdelenie na lavy a pravy panel
@@ -80,6 +99,9 @@ class PlayfairCipherGUI:
         )
         self.input_text.pack(fill=tk.BOTH, expand=False, padx=(3, 0), pady=(0, 10))
 
+        # Priebezne sifrovanie pri kazdej zmene textu (pisanie, vlozenie mysou, zmena z kodu)
+        self.input_text.bind("<<Modified>>", self.on_input_modified)
+
         tk.Label(
             left_frame,
             text="Filtered Encryption Text",
@@ -248,6 +270,15 @@ class PlayfairCipherGUI:
         self.setup_keyword_entry(right_frame)
         self.setup_matrix(right_frame)
 
+        # Tlacidlo na davkove spracovanie suborov
+        ttk.Button(
+            right_frame,
+            text="BATCH FILES",
+            style="Custom.TButton",
+            command=self.open_batch,
+            cursor="hand2",
+        ).pack(fill=tk.X, padx=(3, 0))
+
         self.update_alphabet_info()
 
     def setup_alphabet_selection(self, parent):
@@ -301,7 +332,21 @@ class PlayfairCipherGUI:
             highlightbackground=LIGHT_TXT,
             highlightcolor=LIGHT_TXT,
         )
-        self.keyword_entry.pack(anchor=tk.W, padx=(3, 0), pady=(0, 15))
+        self.keyword_entry.pack(anchor=tk.W, padx=(3, 0), pady=(0, 5))
+
+        # Prepinac priebezneho sifrovania
+        tk.Checkbutton(
+            parent,
+            text="Live encryption",
+            variable=self.live_var,
+            bg=DARK_BG,
+            fg=LIGHT_TXT,
+            selectcolor=BUTTON_BG,
+            font=("Consolas", 10),
+            command=self.toggle_live,
+            activebackground=DARK_BG,
+            activeforeground=LIGHT_TXT,
+        ).pack(anchor=tk.W, pady=(0, 10))
 
         # Realtime matrix update
         self.keyword_entry.bind("<KeyRelease>", self.update_matrix_realtime)
@@ -332,6 +377,19 @@ class PlayfairCipherGUI:
                 row.append(label)
             self.matrix_labels.append(row)
 
+    def close(self):
+        # Pred zatvorenim zrusi bezace davkove ulohy, inak by sa cakalo na ich dokoncenie
+        if self.batch_panel is not None and self.batch_panel.window.winfo_exists():
+            self.batch_panel.close()
+        self.root.destroy()
+
+    def open_batch(self):
+        # Otvori okno davkoveho spracovania, alebo ho prenesie dopredu
+        if self.batch_panel is not None and self.batch_panel.window.winfo_exists():
+            self.batch_panel.window.lift()
+            return
+        self.batch_panel = BatchPanel(self)
+
     def change_alphabet(self):
         choice = self.alphabet_var.get()
         if choice == "CZECH":
@@ -341,6 +399,11 @@ class PlayfairCipherGUI:
 
         self.update_alphabet_info()
 
+        # Ina abeceda meni filtrovanie, preto sa live rezim spusti odznova
+        if self.live_var.get():
+            self.live = None
+            self.update_live()
+
     def update_alphabet_info(self):
 
         choice = self.alphabet_var.get()
@@ -366,16 +429,29 @@ class PlayfairCipherGUI:
 
     def update_matrix_realtime(self, event=None):
         # Aktualizuje maticu v realnom case pri pisani kluca
+        key = self.keyword_entry.get().strip()
         try:
-            key = self.keyword_entry.get().strip()
-            if not key:
-                return
-
-            matrix = create_matrix(key, self.current_alphabet)
-            self.update_matrix(matrix)
+            if key:
+                matrix = create_matrix(key, self.current_alphabet)
+                self.update_matrix(matrix)
         except Exception as e:
             pass
 
+        # V live rezime znovu zasifruje uz rozdelene bigramy novym klucom
+        if not self.live_var.get():
+            return
+        if self.live is None:
+            self.update_live()
+            return
+        try:
+            if self.live.set_key(key):
+                self.set_text(self.output_text, format_five(self.live.ciphertext()))
+                self.highlight_live()
+        except ValueError:
+            # Vystup by patril k predchadzajucemu klucu, preto sa vymaze
+            self.live = None
+            self.clear_live()
+
     def update_matrix(self, matrix, highlight_positions=None):
         # Aktualizuje zobrazenie matice a popripade zvyrazni pouzite pismena
         for i in range(5):
@@ -411,8 +487,110 @@ class PlayfairCipherGUI:
         widget.insert(1.0, text)
         widget.config(state=tk.DISABLED)
 
+    def replace_text(self, widget, start, end, text):
+        # Nahradi cast textu vo widgete, end=None znamena az po koniec
+        end_index = f"1.0 + {end} chars" if end is not None else "end-1c"
+        widget.config(state=tk.NORMAL)
+        widget.delete(f"1.0 + {start} chars", end_index)
+        widget.insert(f"1.0 + {start} chars", text)
+        widget.config(state=tk.DISABLED)
+
+    def toggle_live(self):
+        # Zapne alebo vypne priebezne sifrovanie
+        self.live = None
+        if self.live_var.get():
+            self.update_live()
+
+    def on_input_modified(self, event=None):
+        # Zrusenie priznaku vyvola <<Modified>> znova, vtedy uz nie je co robit
+        if not self.input_text.edit_modified():
+            return
+        self.input_text.edit_modified(False)
+        self.update_live()
+
+    def clear_live(self):
+        # Vymaze panely live rezimu
+        self.set_text(self.filtered_encrypt_text, "")
+        self.set_text(self.filtered_decrypt_text, "")
+        self.set_text(self.output_text, "")
+
+    def update_live(self, event=None):
+        # Prepocita len zmenene bigramy a upravi vystup na mieste
+        if not self.live_var.get():
+            return
+        key = self.keyword_entry.get().strip()
+        text = self.input_text.get(1.0, tk.END).strip()
+        if self.live is None:
+            # Bez platneho kluca sa nic nezobrazi
+            self.clear_live()
+            try:
+                self.live = LiveEncryptor(key, self.current_alphabet)
+            except ValueError:
+                return
+
+        first, old_stop, new_stop = self.live.update_text(text)
+        if first == old_stop == new_stop:
+            return
+        count = len(self.live.bigrams)
+        changed = self.live.bigrams[first:new_stop]
+
+        # Panel bigramov: kazdy bigram zabera 3 znaky ("AB ")
+        if new_stop < count:
+            self.replace_text(
+                self.filtered_encrypt_text,
+                3 * first,
+                3 * old_stop,
+                "".join(bg + " " for bg in changed),
+            )
+        else:
+            start = 3 * first - 1 if first > 0 else 0
+            prefix = " " if first > 0 and changed else ""
+            self.replace_text(
+                self.filtered_encrypt_text, start, None, prefix + " ".join(changed)
+            )
+
+        # Vystup je v skupinach po 5 znakov, kazda skupina zabera 6 znakov ("ABCDE ")
+        if new_stop == old_stop:
+            # Dlzka sa nezmenila, prepisu sa len skupiny so zmenenymi znakmi
+            first_group = (2 * first) // 5
+            stop_group = -(-2 * new_stop // 5)
+            start = 5 * first_group
+            end = min(5 * stop_group, 2 * count)
+            chars = "".join(self.live.encrypted[start // 2 : -(-end // 2)])
+            chars = chars[start % 2 : start % 2 + end - start]
+            groups = format_five(chars)
+            self.replace_text(
+                self.output_text, 6 * first_group, 6 * first_group + len(groups), groups
+            )
+        else:
+            # Zmenena dlzka posunie skupiny, prepise sa od prvej zmenenej skupiny
+            group = (2 * first) // 5 * 5
+            tail = format_five(
+                "".join(self.live.encrypted[group // 2 :])[group % 2 :]
+            )
+            if group > 0:
+                start = group + group // 5 - 1
+                tail = " " + tail if tail else ""
+            else:
+                start = 0
+            self.replace_text(self.output_text, start, None, tail)
+
+        self.highlight_live()
+
+    def highlight_live(self):
+        # Zvyrazni pismena pouzite v live rezime
+        matrix = self.live.matrix
+        used_positions = set()
+        for char in self.live.used_letters():
+            pos = find_position(matrix, char)
+            if pos:
+                used_positions.add(pos)
+        self.update_matrix(matrix, used_positions)
+
     def do_encrypt(self):
         # Ziska vstup, kluc, zasifruje, zobrazi vysledky a zvyrazni pouzite pismena
+        # Panely sa prepisu cele, live rezim sa pri dalsej zmene spusti odznova
+        self.live = None
         try:
             plaintext = self.input_text.get(1.0, tk.END).strip()
             key = self.keyword_entry.get().strip()
@@ -438,6 +616,8 @@ class PlayfairCipherGUI:
 
     def do_decrypt(self):
         # Ziska vstup, kluc, desifruje, zobrazi vysledky a zvyrazni pouzite pismena
+        # Panely sa prepisu cele, live rezim sa pri dalsej zmene spusti odznova
+        self.live = None
         try:
             ciphertext = self.input_text.get(1.0, tk.END).strip()
             key = self.keyword_entry.get().strip()
@@ -461,3 +641,406 @@ class PlayfairCipherGUI:
             self.set_text(self.filtered_encrypt_text, "")
         except Exception as e:
             messagebox.showerror("Decryption Error", str(e))
+
+
+class BatchPanel:
+    def __init__(self, app):
+        # Okno pre davkove sifrovanie suborov v procesoch na pozadi
+        self.app = app
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Playfair Cipher - Batch")
+        self.window.geometry("650x450")
+        self.window.configure(bg=DARK_BG)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.output_var = tk.StringVar(value="")
+        self.jobs = {}
+        self.next_job_id = 1
+        self.executor = None
+        self.progress_queue = None
+        self.cancel_event = None
+        self.batch_start = None
+        self.batch_end = None
+        self.poll_id = None
+        self.setup_ui()
+        self.poll_id = self.window.after(100, self.poll)
+
+    def setup_ui(self):
+        frame = tk.Frame(self.window, bg=DARK_BG)
+        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        # Vyber suborov
+        file_frame = tk.Frame(frame, bg=DARK_BG)
+        file_frame.pack(fill=tk.X, pady=(0, 5))
+        for text, command in (
+            ("ADD FILES", self.add_files),
+            ("ADD FOLDER", self.add_folder),
+            ("CLEAR", self.clear_finished),
+        ):
+            ttk.Button(
+                file_frame,
+                text=text,
+                style="Custom.TButton",
+                command=command,
+                cursor="hand2",
+            ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+
+        # Zoznam uloh s priebehom
+        style = ttk.Style()
+        style.configure(
+            "Custom.Treeview",
+            background=DARK_ENTRY,
+            fieldbackground=DARK_ENTRY,
+            foreground=LIGHT_TXT,
+            font=FONT,
+        )
+        style.configure(
+            "Custom.Treeview.Heading",
+            background=BUTTON_BG,
+            foreground=LIGHT_TXT,
+            font=("Consolas", 10, "bold"),
+        )
+        self.tree = ttk.Treeview(
+            frame,
+            columns=("file", "status", "progress", "speed"),
+            show="headings",
+            height=10,
+            style="Custom.Treeview",
+        )
+        for column, text, width in (
+            ("file", "File", 260),
+            ("status", "Status", 130),
+            ("progress", "Progress", 80),
+            ("speed", "Speed", 130),
+        ):
+            self.tree.heading(column, text=text)
+            self.tree.column(column, width=width, anchor=tk.W)
+        self.tree.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+
+        # Kluc a abeceda (abeceda je spolocna s hlavnym oknom)
+        settings_frame = tk.Frame(frame, bg=DARK_BG)
+        settings_frame.pack(fill=tk.X, pady=(0, 5))
+        tk.Label(
+            settings_frame, text="Keyword", bg=DARK_BG, fg=LIGHT_TXT, font=LABEL_FONT
+        ).pack(side=tk.LEFT)
+        self.keyword_entry = tk.Entry(
+            settings_frame,
+            bg=DARK_ENTRY,
+            fg=LIGHT_TXT,
+            insertbackground=LIGHT_TXT,
+            font=FONT,
+            width=20,
+            relief=tk.FLAT,
+            borderwidth=1,
+            highlightthickness=1,
+            highlightbackground=LIGHT_TXT,
+            highlightcolor=LIGHT_TXT,
+        )
+        self.keyword_entry.insert(0, self.app.keyword_entry.get().strip())
+        self.keyword_entry.pack(side=tk.LEFT, padx=(10, 15))
+        for value in ("CZECH", "ENGLISH"):
+            tk.Radiobutton(
+                settings_frame,
+                text=value,
+                variable=self.app.alphabet_var,
+                value=value,
+                bg=DARK_BG,
+                fg=LIGHT_TXT,
+                selectcolor=BUTTON_BG,
+                font=("Consolas", 10),
+                command=self.app.change_alphabet,
+                activebackground=DARK_BG,
+                activeforeground=LIGHT_TXT,
+            ).pack(side=tk.LEFT, padx=(0, 10))
+
+        # Vystupny priecinok
+        output_frame = tk.Frame(frame, bg=DARK_BG)
+        output_frame.pack(fill=tk.X, pady=(0, 5))
+        tk.Label(
+            output_frame, text="Output", bg=DARK_BG, fg=LIGHT_TXT, font=LABEL_FONT
+        ).pack(side=tk.LEFT)
+        tk.Entry(
+            output_frame,
+            textvariable=self.output_var,
+            bg=DARK_ENTRY,
+            fg=LIGHT_TXT,
+            font=FONT,
+            state="readonly",
+            readonlybackground=DARK_ENTRY,
+            relief=tk.FLAT,
+            borderwidth=1,
+            highlightthickness=1,
+            highlightbackground=LIGHT_TXT,
+            highlightcolor=LIGHT_TXT,
+        ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10, 5))
+        ttk.Button(
+            output_frame,
+            text="BROWSE",
+            style="Custom.TButton",
+            command=self.choose_output,
+            cursor="hand2",
+        ).pack(side=tk.LEFT)
+
+        # Spustenie a zrusenie uloh
+        button_frame = tk.Frame(frame, bg=DARK_BG)
+        button_frame.pack(fill=tk.X, pady=(5, 5))
+        for text, command in (
+            ("ENCRYPT", lambda: self.queue_jobs(decrypt=False)),
+            ("DECRYPT", lambda: self.queue_jobs(decrypt=True)),
+            ("CANCEL", self.cancel),
+        ):
+            ttk.Button(
+                button_frame,
+                text=text,
+                style="Custom.TButton",
+                command=command,
+                cursor="hand2",
+            ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+
+        # Celkova priepustnost
+        self.status_label = tk.Label(
+            frame, text="", bg=DARK_BG, fg=LIGHT_TXT, font=FONT, anchor=tk.W
+        )
+        self.status_label.pack(fill=tk.X)
+
+    def add_path(self, path):
+        # Prida subor do zoznamu, ak tam este nie je
+        path = os.path.abspath(path)
+        if any(job["source"] == path and not job["finished"] for job in self.jobs.values()):
+            return
+        job_id = self.next_job_id
+        self.next_job_id += 1
+        self.tree.insert(
+            "", tk.END, iid=str(job_id), values=(os.path.basename(path), "Ready", "", "")
+        )
+        self.jobs[job_id] = {
+            "source": path,
+            "future": None,
+            "finished": False,
+            "done": 0,
+            "total": 0,
+            "target": None,
+            "queued": None,
+            "start": None,
+        }
+
+    def add_files(self):
+        for path in filedialog.askopenfilenames(parent=self.window):
+            self.add_path(path)
+
+    def add_folder(self):
+        folder = filedialog.askdirectory(parent=self.window)
+        if not folder:
+            return
+        for entry in sorted(os.scandir(folder), key=lambda e: e.name):
+            if entry.is_file():
+                self.add_path(entry.path)
+
+    def choose_output(self):
+        folder = filedialog.askdirectory(parent=self.window)
+        if folder:
+            self.output_var.set(folder)
+
+    def clear_finished(self):
+        # Odstrani zo zoznamu ulohy, ktore uz nebezia
+        for job_id, job in list(self.jobs.items()):
+            if job["future"] is None or job["finished"]:
+                self.tree.delete(str(job_id))
+                del self.jobs[job_id]
+
+    def set_job(self, job_id, status=None, progress=None, speed=None):
+        item = str(job_id)
+        values = list(self.tree.item(item, "values"))
+        for index, value in ((1, status), (2, progress), (3, speed)):
+            if value is not None:
+                values[index] = value
+        self.tree.item(item, values=values)
+
+    def start_executor(self):
+        # Procesy sa vytvaraju cez spawn, aby nezdedili stav Tk
+        context = multiprocessing.get_context("spawn")
+        self.progress_queue = context.Queue()
+        self.cancel_event = context.Event()
+        self.executor = ProcessPoolExecutor(
+            max_workers=worker_count(),
+            mp_context=context,
+            initializer=init_worker,
+            initargs=(self.progress_queue, self.cancel_event),
+        )
+
+    def queue_jobs(self, decrypt):
+        # Zaradi vsetky pripravene subory s aktualnym klucom a abecedou
+        key = self.keyword_entry.get().strip()
+        alphabet = self.app.current_alphabet
+        target_dir = self.output_var.get()
+        try:
+            validate_key(key, alphabet)
+        except ValueError as e:
+            messagebox.showerror("Batch Error", str(e), parent=self.window)
+            return
+        if not target_dir or not os.path.isdir(target_dir):
+            messagebox.showwarning(
+                "Error", "Please choose an output folder!", parent=self.window
+            )
+            return
+
+        # Ulohy odmietnute pre kolizny vystup su uz ukoncene a znova sa neskusaju
+        ready = [
+            (job_id, job)
+            for job_id, job in self.jobs.items()
+            if job["future"] is None and not job["finished"]
+        ]
+        # Vystupy, do ktorych este zapisuju zaradene alebo bezace ulohy
+        targets = {
+            os.path.normcase(job["target"])
+            for job in self.jobs.values()
+            if job["future"] is not None and not job["finished"]
+        }
+        accepted = []
+        existing = []
+        for job_id, job in ready:
+            # Vysledky rovnakej operacie sa znova nespracuvaju
+            if is_output_file(job["source"], decrypt):
+                operation = "decrypted" if decrypt else "encrypted"
+                self.set_job(job_id, status=f"Skipped: already {operation}")
+                continue
+            target = os.path.abspath(output_path(job["source"], target_dir, decrypt))
+            # Subory s rovnakym nazvom z roznych priecinkov by sa navzajom prepisali
+            if os.path.normcase(target) in targets:
+                job["finished"] = True
+                self.set_job(
+                    job_id, status=f"Error: {os.path.basename(target)} already used"
+                )
+                continue
+            targets.add(os.path.normcase(target))
+            accepted.append((job_id, job, target))
+            if os.path.exists(target):
+                existing.append(target)
+
+        # Existujuce vystupy sa prepisu len po potvrdeni
+        if existing and not messagebox.askyesno(
+            "Overwrite",
+            f"{len(existing)} output file(s) already exist. Overwrite them?",
+            parent=self.window,
+        ):
+            for job_id, job, target in accepted:
+                if target in existing:
+                    self.set_job(job_id, status="Skipped: output exists")
+            accepted = [item for item in accepted if item[2] not in existing]
+        if not accepted:
+            return
+
+        if self.executor is None:
+            self.start_executor()
+        # Nova davka zacina, ked predchadzajuca skoncila
+        if self.batch_start is None or self.batch_end is not None:
+            self.batch_start = time.perf_counter()
+            self.batch_end = None
+        for job_id, job, target in accepted:
+            job["target"] = target
+            job["queued"] = time.perf_counter()
+            job["future"] = self.executor.submit(
+                process_file, job_id, job["source"], target, key, alphabet, decrypt
+            )
+            self.set_job(job_id, status="Queued", progress="0 %")
+
+    def cancel(self):
+        # Zrusi cakajuce ulohy a signalom zastavi bezace
+        if self.executor is None:
+            return
+        self.cancel_event.set()
+        for job in self.jobs.values():
+            if job["future"] is not None and not job["finished"]:
+                job["future"].cancel()
+        self.executor.shutdown(wait=False)
+        # Dalsie ulohy dostanu novy pool s novym signalom
+        self.executor = None
+        self.progress_queue = None
+        self.cancel_event = None
+
+    def poll(self):
+        # Spracuje hlasenia z procesov bez blokovania hlavnej slucky Tk
+        if not self.window.winfo_exists():
+            return
+        while self.progress_queue is not None:
+            try:
+                job_id, done, total = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            job = self.jobs.get(job_id)
+            if job is None or job["finished"]:
+                continue
+            job["done"], job["total"] = done, total
+            if job["start"] is None:
+                job["start"] = time.perf_counter()
+            percent = done * 100 // total if total else 100
+            elapsed = time.perf_counter() - job["start"]
+            self.set_job(
+                job_id,
+                status="Running",
+                progress=f"{percent} %",
+                speed=format_speed(done, elapsed),
+            )
+
+        for job_id, job in self.jobs.items():
+            future = job["future"]
+            if future is None or job["finished"] or not future.done():
+                continue
+            job["finished"] = True
+            if future.cancelled():
+                self.set_job(job_id, status="Cancelled")
+                continue
+            error = future.exception()
+            if isinstance(error, JobCancelled):
+                self.set_job(job_id, status="Cancelled")
+            elif error is not None:
+                self.set_job(job_id, status=f"Error: {error}")
+            else:
+                chars, elapsed = future.result()
+                job["done"] = job["total"] = chars
+                self.set_job(
+                    job_id,
+                    status="Done",
+                    progress="100 %",
+                    speed=format_speed(chars, elapsed),
+                )
+
+        self.update_status()
+        self.poll_id = self.window.after(100, self.poll)
+
+    def update_status(self):
+        # Zobrazi pocet hotovych suborov a celkovu priepustnost
+        if self.batch_start is None:
+            return
+        started = [
+            job
+            for job in self.jobs.values()
+            if job["queued"] is not None and job["queued"] >= self.batch_start
+        ]
+        if not started:
+            self.status_label.config(text="")
+            return
+        finished = sum(1 for job in started if job["finished"])
+        if finished == len(started) and self.batch_end is None:
+            self.batch_end = time.perf_counter()
+        chars = sum(job["done"] for job in started)
+        elapsed = (self.batch_end or time.perf_counter()) - self.batch_start
+        self.status_label.config(
+            text=f"{finished}/{len(started)} files, {format_speed(chars, elapsed)}"
+        )
+
+    def close(self):
+        # Zrusi casovac, inak by po zatvoreni okna volal neexistujuci prikaz Tk
+        self.window.after_cancel(self.poll_id)
+        self.cancel()
+        self.window.destroy()
+
+
+def format_speed(chars, elapsed):
+    # Naformatuje rychlost spracovania v znakoch za sekundu
+    rate = chars / elapsed if elapsed > 0 else 0
+    if rate >= 1_000_000:
+        return f"{rate / 1_000_000:.1f} M chars/s"
+    if rate >= 1_000:
+        return f"{rate / 1_000:.1f} k chars/s"
+    return f"{rate:.0f} chars/s"
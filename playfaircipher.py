@@ -1,5 +1,7 @@
 import unicodedata
-from typing import List, Tuple, Optional
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterator, List, Tuple, Optional
 
 ALPHABET_CZECH = "ABCDEFGHIJKLMNOPQRSTUVXYZ"  # Without W
 ALPHABET_ENGLISH = "ABCDEFGHIKLMNOPQRSTUVWXYZ"  # Without J
@@ -93,31 +95,30 @@ def get_padding_char(avoid_char: str, alphabet: str) -> str:
     return "X"
 
 
-# Rozdeli text na dvojice znakov, spracuje specialne pripady (medzery, cislice, opakovane znaky)
-def prepare_bigrams(text: str, alphabet: str) -> List[str]:
-    bigrams = []
-    i = 0
+# Prechadza text a vracia dvojice (pozicia, bigram), spracuje specialne pripady (medzery, cislice, opakovane znaky)
+def iter_bigrams(text: str, alphabet: str, start: int = 0) -> Iterator[Tuple[int, str]]:
+    i = start
     while i < len(text):
         if text[i : i + 8] == SPACE_MARKER:
-            bigrams.append("XM")
-            bigrams.append("EZ")
-            bigrams.append("ER")
-            bigrams.append("AX")
+            yield (i, "XM")
+            yield (i + 2, "EZ")
+            yield (i + 4, "ER")
+            yield (i + 6, "AX")
             i += 8
             continue
         # Ak je znak cislica, spracujeme ju specialne
         if text[i].isdigit():
             if i + 1 < len(text) and text[i + 1].isdigit():
-                bigrams.append(text[i] + text[i + 1])
+                yield (i, text[i] + text[i + 1])
                 i += 2
             else:
-                bigrams.append(text[i] + text[i])
+                yield (i, text[i] + text[i])
                 i += 1
             continue
         # Ak je posledny znak, doplnime padding
         if i == len(text) - 1:
             padding = get_padding_char(text[i], alphabet)
-            bigrams.append(text[i] + padding)
+            yield (i, text[i] + padding)
             i += 1
         else:
             first = text[i]
@@ -125,12 +126,16 @@ def prepare_bigrams(text: str, alphabet: str) -> List[str]:
             # Ak su dva rovnake znaky za sebou, vlozime padding
             if first == second and first in alphabet:
                 padding = get_padding_char(first, alphabet)
-                bigrams.append(first + padding)
+                yield (i, first + padding)
                 i += 1
             else:
-                bigrams.append(first + second)
+                yield (i, first + second)
                 i += 2
-    return bigrams
+
+
+# Rozdeli text na dvojice znakov
+def prepare_bigrams(text: str, alphabet: str) -> List[str]:
+    return [bigram for _, bigram in iter_bigrams(text, alphabet)]
 
 
 # Zasifruje alebo desifruje jeden bigram
@@ -187,17 +192,22 @@ def remove_padding(text: str) -> str:
     return text
 
 
+# Skontroluje, ci je kluc pouzitelny pre danu abecedu
+def validate_key(key: str, alphabet: str) -> None:
+    if not key or not key.strip():
+        raise ValueError("Keyword cannot be empty!")
+    key_filtered = filter_input(key, alphabet)
+    if not any(c in alphabet for c in key_filtered):
+        raise ValueError("Keyword must contain at least one valid letter!")
+
+
 # Pripravi bigramy, zasifruje ich a vrati vysledok
 def encrypt(
     plaintext: str, key: str, alphabet: str
 ) -> Tuple[str, str, List[str], List[List[str]]]:
     if not plaintext or not plaintext.strip():
         raise ValueError("Input text cannot be empty!")
-    if not key or not key.strip():
-        raise ValueError("Keyword cannot be empty!")
-    key_filtered = filter_input(key, alphabet)
-    if not any(c in alphabet for c in key_filtered):
-        raise ValueError("Keyword must contain at least one valid letter!")
+    validate_key(key, alphabet)
     filtered = filter_input(plaintext, alphabet)
     if not filtered:
         raise ValueError("Input text must contain at least one valid character!")
@@ -217,11 +227,7 @@ def decrypt(
 ) -> Tuple[str, List[List[str]], List[str]]:
     if not ciphertext or not ciphertext.strip():
         raise ValueError("Ciphertext cannot be empty!")
-    if not key or not key.strip():
-        raise ValueError("Keyword cannot be empty!")
-    key_filtered = filter_input(key, alphabet)
-    if not any(c in alphabet for c in key_filtered):
-        raise ValueError("Keyword must contain at least one valid letter!")
+    validate_key(key, alphabet)
     # Odstrani medzery a zmeni na velke pismena
     cipher_clean = ciphertext.replace(" ", "").upper()
     if not cipher_clean:
@@ -236,3 +242,157 @@ def decrypt(
     plaintext = restore_spaces(plaintext)
     plaintext = remove_padding(plaintext)
     return (plaintext, matrix, decrypted_bigrams)
+
+
+# Overeny kluc s maticou, ktory si pamata uz spracovane bigramy
+class CompiledKey(dict):
+    def __init__(self, key: str, alphabet: str, decrypt: bool = False):
+        super().__init__()
+        validate_key(key, alphabet)
+        self.alphabet = alphabet
+        self.decrypt = decrypt
+        self.matrix = create_matrix(key, alphabet)
+
+    def __missing__(self, bigram: str) -> str:
+        result = process_bigram(bigram, self.matrix, self.alphabet, self.decrypt)
+        self[bigram] = result
+        return result
+
+
+# Zasifruje text uz pripravenym klucom, vrati len sifrovany text
+def encrypt_compiled(plaintext: str, compiled: CompiledKey) -> str:
+    filtered = filter_input(plaintext, compiled.alphabet)
+    return "".join([compiled[bg] for bg in prepare_bigrams(filtered, compiled.alphabet)])
+
+
+# Desifruje text uz pripravenym klucom, vrati len otvoreny text
+def decrypt_compiled(ciphertext: str, compiled: CompiledKey) -> str:
+    cipher_clean = ciphertext.replace(" ", "").upper()
+    if len(cipher_clean) % 2:
+        raise ValueError("Ciphertext must have an even number of characters!")
+    plaintext = "".join(
+        [compiled[cipher_clean[i : i + 2]] for i in range(0, len(cipher_clean), 2)]
+    )
+    return remove_padding(restore_spaces(plaintext))
+
+
+# Najdlhsi spolocny zaciatok dvoch retazcov (binarne vyhladavanie cez porovnanie rezov)
+def common_prefix_length(a: str, b: str) -> int:
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+# Najdlhsi spolocny koniec dvoch retazcov, najviac limit znakov
+def common_suffix_length(a: str, b: str, limit: int) -> int:
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid :] == b[len(b) - mid :]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+# Priebezne sifrovanie: pri zmene textu prepocita len bigramy od prveho dotknuteho
+class LiveEncryptor:
+    def __init__(self, key: str, alphabet: str):
+        self.alphabet = alphabet
+        self.text = ""
+        self.filtered = ""
+        # Pocet filtrovanych znakov, ktore vznikli z kazdeho znaku vstupu
+        self.widths: List[int] = []
+        # Pozicia kazdeho bigramu vo filtrovanom texte
+        self.starts: List[int] = []
+        self.bigrams: List[str] = []
+        self.encrypted: List[str] = []
+        # Pocet vyskytov kazdeho znaku v bigramoch (pre zvyraznenie matice)
+        self.letter_counts: Counter = Counter()
+        self.matrix: List[List[str]] = []
+        self.compiled: Optional[CompiledKey] = None
+        self._width_cache: Dict[str, int] = {}
+        self.set_key(key)
+
+    # Zmeni kluc a znovu zasifruje uz rozdelene bigramy, vrati ci sa matica zmenila
+    def set_key(self, key: str) -> bool:
+        compiled = CompiledKey(key, self.alphabet)
+        if compiled.matrix == self.matrix:
+            return False
+        self.compiled = compiled
+        self.matrix = compiled.matrix
+        self.encrypted = [compiled[bg] for bg in self.bigrams]
+        return True
+
+    def _width(self, char: str) -> int:
+        width = self._width_cache.get(char)
+        if width is None:
+            width = len(filter_input(char, self.alphabet))
+            self._width_cache[char] = width
+        return width
+
+    # Aplikuje novy text a vrati (prvy zmeneny bigram, koniec starych zmenenych, koniec novych zmenenych)
+    def update_text(self, text: str) -> Tuple[int, int, int]:
+        old_text = self.text
+        old_filtered = self.filtered
+        old_starts = self.starts
+        count = len(old_starts)
+        if text == old_text:
+            return (count, count, count)
+
+        # Najde zmeneny usek vstupu
+        prefix = common_prefix_length(old_text, text)
+        limit = min(len(old_text), len(text)) - prefix
+        suffix = common_suffix_length(old_text, text, limit)
+        old_end = len(old_text) - suffix
+        middle = text[prefix : len(text) - suffix]
+
+        # Filtrovanie je po znakoch, preto staci prefiltrovat len zmeneny usek
+        f_start = sum(self.widths[:prefix])
+        f_old_end = f_start + sum(self.widths[prefix:old_end])
+        f_middle = filter_input(middle, self.alphabet)
+        f_new_end = f_start + len(f_middle)
+        delta = f_new_end - f_old_end
+        filtered = old_filtered[:f_start] + f_middle + old_filtered[f_old_end:]
+        self.widths[prefix:old_end] = [self._width(c) for c in middle]
+
+        # Bigram zavisi najviac od len(SPACE_MARKER) znakov od svojho zaciatku
+        first = bisect_left(old_starts, f_start - len(SPACE_MARKER) + 1)
+        position = old_starts[first] if first < count else len(old_filtered)
+
+        # Znovu rozdeli text, kym sa nezosynchronizuje so starym rozdelenim za zmenou
+        stop = count
+        new_starts = []
+        new_bigrams = []
+        for i, bigram in iter_bigrams(filtered, self.alphabet, position):
+            if i >= f_new_end:
+                index = bisect_left(old_starts, i - delta)
+                if index < count and old_starts[index] == i - delta:
+                    stop = index
+                    break
+            new_starts.append(i)
+            new_bigrams.append(bigram)
+
+        tail = old_starts[stop:]
+        if delta:
+            tail = [s + delta for s in tail]
+        self.starts[first:] = new_starts + tail
+        self.letter_counts.subtract("".join(self.bigrams[first:stop]))
+        self.letter_counts.update("".join(new_bigrams))
+        self.bigrams[first:stop] = new_bigrams
+        self.encrypted[first:stop] = [self.compiled[bg] for bg in new_bigrams]
+        self.text = text
+        self.filtered = filtered
+        return (first, stop, first + len(new_bigrams))
+
+    # Znaky, ktore sa aktualne vyskytuju v niektorom bigrame
+    def used_letters(self) -> List[str]:
+        return [char for char, count in self.letter_counts.items() if count > 0]
+
+    def ciphertext(self) -> str:
+        return "".join(self.encrypted)
@@ -0,0 +1,257 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from playfaircipher import (
+    CompiledKey,
+    encrypt_compiled,
+    decrypt_compiled,
+    ALPHABET_CZECH,
+    ALPHABET_ENGLISH,
+)
+
+ALPHABETS = {"CZECH": ALPHABET_CZECH, "ENGLISH": ALPHABET_ENGLISH}
+FORMATS = ("csv", "jsonl")
+BUFFER_SIZE = 1 << 20
+BATCH_SIZE = 1000
+
+
+# Pripravene kluce sa zdielaju medzi davkami aj subormi
+@lru_cache(maxsize=256)
+def get_compiled_key(key: str, alphabet: str, decrypt: bool) -> CompiledKey:
+    return CompiledKey(key, alphabet, decrypt)
+
+
+# Urci format suboru podla pripony
+def detect_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension == "json":
+        extension = "jsonl"
+    if extension not in FORMATS:
+        raise ValueError(f"Cannot detect record format of '{path}', use csv or jsonl")
+    return extension
+
+
+# Zasifruje alebo desifruje vybrane polia v davke riadkov (riadky meni na mieste)
+def process_batch(
+    rows: Sequence[dict],
+    fields: Sequence[str],
+    alphabet: str,
+    decrypt: bool = False,
+    key: Optional[str] = None,
+    key_column: Optional[str] = None,
+    first_row: int = 1,
+) -> None:
+    # Zoskupi hodnoty podla kluca, aby sa kazdy kluc pripravil len raz
+    groups: Dict[str, List[Tuple[int, dict, str]]] = {}
+    for number, row in enumerate(rows, first_row):
+        row_key = key if key_column is None else row.get(key_column)
+        # Kluc z JSONL moze byt aj cislo alebo zoznam, skupiny sa tvoria podla textu
+        row_key = "" if row_key is None else str(row_key)
+        for field in fields:
+            value = row.get(field)
+            if value is None or value == "":
+                continue
+            groups.setdefault(row_key, []).append((number, row, field))
+
+    convert = decrypt_compiled if decrypt else encrypt_compiled
+    for row_key, targets in groups.items():
+        number = targets[0][0]
+        try:
+            compiled = get_compiled_key(row_key, alphabet, decrypt)
+        except ValueError as e:
+            raise ValueError(f"Row {number}: {e}") from None
+        # Rovnake hodnoty s rovnakym klucom sa spracuju len raz
+        results: Dict[str, str] = {}
+        for number, row, field in targets:
+            value = str(row[field])
+            result = results.get(value)
+            if result is None:
+                try:
+                    result = convert(value, compiled)
+                except ValueError as e:
+                    raise ValueError(f"Row {number}, field '{field}': {e}") from None
+                results[value] = result
+            row[field] = result
+
+
+# Nacita CSV po riadkoch, skontroluje hlavicku a vrati (stlpce, riadky)
+def read_csv(stream, required: Iterable[str]) -> Tuple[List[str], Iterable[dict]]:
+    reader = csv.DictReader(stream)
+    columns = reader.fieldnames or []
+    missing = [name for name in required if name not in columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    return (columns, reader)
+
+
+# Nacita JSONL po riadkoch, prazdne riadky preskoci
+def read_jsonl(stream) -> Iterable[dict]:
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        row = json.loads(line)
+        if not isinstance(row, dict):
+            raise ValueError(f"Line {number}: record must be a JSON object")
+        yield row
+
+
+# Docasny subor ma prava 0600, vysledok dostane prava ciela alebo beznu predvolbu
+def copy_mode(target: str, temp_path: str) -> None:
+    if os.path.exists(target):
+        mode = os.stat(target).st_mode & 0o7777
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    os.chmod(temp_path, mode)
+
+
+# Spracuje cely subor po davkach a vrati (pocet riadkov, cas v sekundach)
+def process_file(
+    source: str,
+    target: str,
+    fields: Sequence[str],
+    alphabet: str,
+    decrypt: bool = False,
+    key: Optional[str] = None,
+    key_column: Optional[str] = None,
+    record_format: Optional[str] = None,
+    batch_size: int = BATCH_SIZE,
+    progress: Optional[Callable[[int, float], None]] = None,
+) -> Tuple[int, float]:
+    if (key is None) == (key_column is None):
+        raise ValueError("Use exactly one of keyword or key column!")
+    if not fields:
+        raise ValueError("No fields selected!")
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1!")
+    record_format = record_format or detect_format(source)
+
+    # Zapisuje sa do docasneho suboru vedla ciela, ciel sa nahradi az po uspechu
+    target_dir = os.path.dirname(os.path.abspath(target))
+    fd, temp_path = tempfile.mkstemp(dir=target_dir, suffix=".tmp")
+    try:
+        with open(
+            fd, "w", encoding="utf-8", newline="", buffering=BUFFER_SIZE
+        ) as fout:
+            count, elapsed = write_records(
+                source,
+                fout,
+                fields,
+                alphabet,
+                decrypt,
+                key,
+                key_column,
+                record_format,
+                batch_size,
+                progress,
+            )
+        copy_mode(target, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return (count, elapsed)
+
+
+# Prechadza zdrojovy subor po davkach a zapisuje spracovane riadky do fout
+def write_records(
+    source: str,
+    fout,
+    fields: Sequence[str],
+    alphabet: str,
+    decrypt: bool,
+    key: Optional[str],
+    key_column: Optional[str],
+    record_format: str,
+    batch_size: int,
+    progress: Optional[Callable[[int, float], None]],
+) -> Tuple[int, float]:
+    start = time.perf_counter()
+    count = 0
+    with open(source, "r", encoding="utf-8", newline="", buffering=BUFFER_SIZE) as fin:
+        if record_format == "csv":
+            required = list(fields) + ([key_column] if key_column else [])
+            columns, rows = read_csv(fin, required)
+            writer = csv.DictWriter(fout, fieldnames=columns)
+            writer.writeheader()
+            write = writer.writerows
+        else:
+            rows = read_jsonl(fin)
+
+            def write(batch):
+                fout.writelines(
+                    json.dumps(row, ensure_ascii=False) + "\n" for row in batch
+                )
+
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            process_batch(batch, fields, alphabet, decrypt, key, key_column, count + 1)
+            write(batch)
+            count += len(batch)
+            if progress:
+                progress(count, time.perf_counter() - start)
+
+    return (count, time.perf_counter() - start)
+
+
+# Vypocita rychlost spracovania v riadkoch za sekundu
+def rows_per_second(count: int, elapsed: float) -> float:
+    return count / elapsed if elapsed > 0 else 0.0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Encrypt or decrypt selected fields in CSV/JSONL files."
+    )
+    parser.add_argument("source", help="input CSV or JSONL file")
+    parser.add_argument("target", help="output file")
+    parser.add_argument(
+        "-f", "--fields", required=True, help="comma separated fields to process"
+    )
+    key_group = parser.add_mutually_exclusive_group(required=True)
+    key_group.add_argument("-k", "--key", help="keyword used for every row")
+    key_group.add_argument("--key-column", help="column holding the keyword per row")
+    parser.add_argument(
+        "-a", "--alphabet", choices=sorted(ALPHABETS), default="CZECH", type=str.upper
+    )
+    parser.add_argument("-d", "--decrypt", action="store_true", help="decrypt fields")
+    parser.add_argument("--format", choices=FORMATS, help="record format")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    fields = [name.strip() for name in args.fields.split(",") if name.strip()]
+    try:
+        count, elapsed = process_file(
+            args.source,
+            args.target,
+            fields,
+            ALPHABETS[args.alphabet],
+            decrypt=args.decrypt,
+            key=args.key,
+            key_column=args.key_column,
+            record_format=args.format,
+            batch_size=args.batch_size,
+        )
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    rate = rows_per_second(count, elapsed)
+    print(f"{count} rows in {elapsed:.2f} s ({rate:.0f} rows/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())